@@ -1,7 +1,11 @@
+import io
+
 import numpy as np
-import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from nucleo import PASO_PKM, Resultados, kernel_resultados
 
 
 # =====================================================
@@ -17,6 +21,13 @@ COLOR_1 = "#002A5C"   # azul oscuro
 COLOR_2 = "#017DC3"   # azul claro
 COLOR_3 = "#005DAB"   # azul medio
 
+# Con más puntos que esto, las curvas se dibujan solo con líneas (sin marcadores)
+MAX_PTS_MARCADORES = 50
+
+# Layout común de todas las figuras (se arma una sola vez, no en cada gráfico)
+_LEGEND = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5)
+BASE_LAYOUT = dict(template="plotly_white", legend=_LEGEND)
+
 st.title("Simulador de demanda y recaudación – Peaje Ruta Viva")
 st.subheader("**Hecho por:** Oikonomics Consultora Económica")
 st.caption(
@@ -38,110 +49,159 @@ DEFAULTS = {
     "pmax": 0.80,
     "npts": 17,
     "tipo_vehiculo": "Ambos",
-    "ruta": "Ruta Viva"
+    "ruta": "Ruta Viva",
+    "mostrar_total": False,
+    "periodo_recaud": "USD por día"
 }
 
-# Inicializa session_state (solo si no existe)
-for k, v in DEFAULTS.items():
-    if k not in st.session_state:
-        st.session_state[k] = v
+
+def _init_session():
+    """Carga DEFAULTS en session_state una sola vez por sesión, no en cada rerun."""
+    if "_sesion_iniciada" in st.session_state:
+        return
+    for k, v in DEFAULTS.items():
+        st.session_state.setdefault(k, v)
+    st.session_state["_sesion_iniciada"] = True
+
+
+_init_session()
 
 
 # =====================================================
 # DATOS (EMBEBIDOS, SIN CARGA DE CSV)
 # =====================================================
 @st.cache_data
-def tabla_probabilidades_base() -> pd.DataFrame:
+def tabla_probabilidades_base() -> tuple[np.ndarray, np.ndarray]:
     """
     Tabla base (tu simulación):
     pkm: tarifa base (USD/km) para livianos
     pr_rv: Prob(Ruta Viva)
     pr_mix: Prob(Mixto)
     pr_int: Prob(Interoceánica)
+
+    Devuelve Y (3, Nx) con filas pr_rv, pr_mix, pr_int y su variación por segmento M (3, Nx-1),
+    en float32 (el núcleo trabaja en simple precisión).
     """
-    return pd.DataFrame({
-        "pkm":   [0.00, 0.05, 0.10, 0.15, 0.20, 0.25, 0.30, 0.35, 0.40, 0.45, 0.50, 0.55, 0.60, 0.65, 0.70, 0.75, 0.80],
-        "pr_rv": [0.46, 0.39, 0.32, 0.25, 0.19, 0.14, 0.10, 0.07, 0.04, 0.03, 0.02, 0.01, 0.01, 0.01, 0.00, 0.00, 0.00],
-        "pr_mix":[0.25, 0.32, 0.39, 0.45, 0.51, 0.56, 0.60, 0.63, 0.65, 0.66, 0.67, 0.68, 0.68, 0.69, 0.69, 0.69, 0.69],
-        "pr_int":[0.28, 0.29, 0.29, 0.30, 0.30, 0.30, 0.30, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31],
-    })
+    pkm    = [0.00, 0.05, 0.10, 0.15, 0.20, 0.25, 0.30, 0.35, 0.40, 0.45, 0.50, 0.55, 0.60, 0.65, 0.70, 0.75, 0.80]
+    pr_rv  = [0.46, 0.39, 0.32, 0.25, 0.19, 0.14, 0.10, 0.07, 0.04, 0.03, 0.02, 0.01, 0.01, 0.01, 0.00, 0.00, 0.00]
+    pr_mix = [0.25, 0.32, 0.39, 0.45, 0.51, 0.56, 0.60, 0.63, 0.65, 0.66, 0.67, 0.68, 0.68, 0.69, 0.69, 0.69, 0.69]
+    pr_int = [0.28, 0.29, 0.29, 0.30, 0.30, 0.30, 0.30, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31, 0.31]
 
+    # El núcleo asume grilla ordenada, sin duplicados y uniforme desde 0 (paso PASO_PKM)
+    if not np.allclose(pkm, PASO_PKM * np.arange(len(pkm))):
+        raise ValueError("La tabla de probabilidades debe tener pkm = 0, PASO_PKM, 2*PASO_PKM, ...")
 
-def interp_clamp(x_grid: np.ndarray, y_grid: np.ndarray, xq: np.ndarray) -> np.ndarray:
-    """Interpolación lineal con clamp en extremos."""
-    return np.interp(xq, x_grid, y_grid, left=y_grid[0], right=y_grid[-1])
+    Y = np.array([pr_rv, pr_mix, pr_int], dtype=np.float32)
+    M = np.diff(Y, axis=1)
+    return Y, M
 
 
-def calcular_resultados(
-    df_prob: pd.DataFrame,
-    tarifa_grid_liv: np.ndarray,
+@st.cache_data(show_spinner=False)
+def _calc_core(
+    pmin: float,
+    pmax: float,
+    npts: int,
     tpda_liv: float,
     tpda_cam: float,
     mult_cam: float,
     dist_km: float
-) -> pd.DataFrame:
+) -> Resultados:
     """
     Calcula probabilidades interpoladas y cantidades esperadas (veh/día) por ruta y tipo de vehículo.
-    Además calcula recaudación esperada (USD/día y USD/año) solo para Ruta Viva.
+    Además calcula recaudación esperada (USD/día) solo para Ruta Viva; lo anual se deriva al graficar/exportar.
+
+    Cacheada por parámetros escalares: un rerun sin cambios en el sidebar no recalcula nada.
     """
-    df_prob = df_prob.sort_values("pkm").drop_duplicates(subset=["pkm"]).reset_index(drop=True)
+    tarifa_grid_liv = np.linspace(pmin, pmax, npts)
 
-    x = df_prob["pkm"].to_numpy(dtype=float)
-    pr_rv  = df_prob["pr_rv"].to_numpy(dtype=float)
-    pr_mix = df_prob["pr_mix"].to_numpy(dtype=float)
-    pr_int = df_prob["pr_int"].to_numpy(dtype=float)
+    # Filas: Ruta Viva, Mixto, Interoceánica -> Y (3, Nx), M (3, Nx-1)
+    Y, M = tabla_probabilidades_base()
 
-    # Livianos: evalúan prob en tarifa base
+    # Livianos evalúan prob en tarifa base; camiones en tarifa multiplicada
     p_liv = tarifa_grid_liv
-    liv_rv  = interp_clamp(x, pr_rv,  p_liv)
-    liv_mix = interp_clamp(x, pr_mix, p_liv)
-    liv_int = interp_clamp(x, pr_int, p_liv)
-
-    # Camiones: evalúan prob en tarifa multiplicada
     p_cam = tarifa_grid_liv * mult_cam
-    cam_rv  = interp_clamp(x, pr_rv,  p_cam)
-    cam_mix = interp_clamp(x, pr_mix, p_cam)
-    cam_int = interp_clamp(x, pr_int, p_cam)
-
-    # Cantidades esperadas
-    q_rv_liv  = tpda_liv * liv_rv
-    q_mix_liv = tpda_liv * liv_mix
-    q_int_liv = tpda_liv * liv_int
-
-    q_rv_cam  = tpda_cam * cam_rv
-    q_mix_cam = tpda_cam * cam_mix
-    q_int_cam = tpda_cam * cam_int
-
-    out = pd.DataFrame({
-        "tarifa_usd_km_livianos": p_liv,
-        "tarifa_usd_km_camiones": p_cam,
-        "distancia_promedio_km": dist_km,
-
-        "pr_rv_liv":  liv_rv,  "Q_rv_liv_veh_dia":  q_rv_liv,
-        "pr_mix_liv": liv_mix, "Q_mix_liv_veh_dia": q_mix_liv,
-        "pr_int_liv": liv_int, "Q_int_liv_veh_dia": q_int_liv,
 
-        "pr_rv_cam":  cam_rv,  "Q_rv_cam_veh_dia":  q_rv_cam,
-        "pr_mix_cam": cam_mix, "Q_mix_cam_veh_dia": q_mix_cam,
-        "pr_int_cam": cam_int, "Q_int_cam_veh_dia": q_int_cam,
-    })
-
-    # Recaudación: solo Ruta Viva
-    out["recaud_liv_usd_dia"] = out["Q_rv_liv_veh_dia"] * (out["tarifa_usd_km_livianos"] * dist_km)
-    out["recaud_cam_usd_dia"] = out["Q_rv_cam_veh_dia"] * (out["tarifa_usd_km_camiones"] * dist_km)
-    out["recaud_total_usd_dia"] = out["recaud_liv_usd_dia"] + out["recaud_cam_usd_dia"]
-
-    # Anual (365)
-    out["recaud_liv_usd_anio"] = out["recaud_liv_usd_dia"] * 365
-    out["recaud_cam_usd_anio"] = out["recaud_cam_usd_dia"] * 365
-    out["recaud_total_usd_anio"] = out["recaud_total_usd_dia"] * 365
+    # Probabilidades, cantidades y recaudación diaria (solo Ruta Viva)
+    # El núcleo trabaja en float32; las tarifas se guardan en float64 para el CSV
+    P, Q, rev_day = kernel_resultados(
+        Y, M, p_liv.astype(np.float32),
+        np.float32(tpda_liv), np.float32(tpda_cam), np.float32(mult_cam), np.float32(dist_km)
+    )
 
-    return out
+    return Resultados(
+        tarifa_liv=p_liv,
+        tarifa_cam=p_cam,
+        dist_km=float(dist_km),
+        p_liv=P[:3],
+        p_cam=P[3:],
+        q_liv=Q[:3],
+        q_cam=Q[3:],
+        rev_day=rev_day,
+    )
 
 
+# Columnas del CSV de descarga y su formato: tarifas exactas, probabilidades con 6 cifras,
+# cantidades y USD diarios con 8 (vienen del núcleo en float32) y anuales con 9 (float64);
+# cifras significativas y no decimales fijos, para no llevar a cero los valores pequeños
+COLUMNAS_CSV = (
+    "tarifa_usd_km_livianos", "tarifa_usd_km_camiones", "distancia_promedio_km",
+    "pr_rv_liv", "Q_rv_liv_veh_dia", "pr_mix_liv", "Q_mix_liv_veh_dia", "pr_int_liv", "Q_int_liv_veh_dia",
+    "pr_rv_cam", "Q_rv_cam_veh_dia", "pr_mix_cam", "Q_mix_cam_veh_dia", "pr_int_cam", "Q_int_cam_veh_dia",
+    "recaud_liv_usd_dia", "recaud_cam_usd_dia", "recaud_total_usd_dia",
+    "recaud_liv_usd_anio", "recaud_cam_usd_anio", "recaud_total_usd_anio",
+)
+FORMATOS_CSV = ["%.10g"] * 3 + ["%.6g", "%.8g"] * 6 + ["%.8g"] * 3 + ["%.9g"] * 3
+ENCABEZADO_CSV = ",".join(COLUMNAS_CSV)
+
+
+def _tabla_csv(res: Resultados) -> np.ndarray:
+    """Apila los resultados en una matriz (npts, columnas) en el orden de COLUMNAS_CSV."""
+    rev_anio = res.rev_day.astype(float) * 365
+    return np.column_stack([
+        res.tarifa_liv, res.tarifa_cam, np.full(res.tarifa_liv.size, res.dist_km),
+        res.p_liv[0], res.q_liv[0], res.p_liv[1], res.q_liv[1], res.p_liv[2], res.q_liv[2],
+        res.p_cam[0], res.q_cam[0], res.p_cam[1], res.q_cam[1], res.p_cam[2], res.q_cam[2],
+        res.rev_day[0], res.rev_day[1], res.rev_day[2],
+        rev_anio[0], rev_anio[1], rev_anio[2],
+    ]).astype(float)
+
+
+@st.cache_data(show_spinner=False)
+def _csv_bytes(arr_bytes: bytes, forma: tuple, encabezado: str) -> bytes:
+    """CSV de resultados; la clave de caché es (bytes de la tabla float64, su forma, encabezado)."""
+    arr = np.frombuffer(arr_bytes, dtype=float).reshape(forma)
+    buf = io.BytesIO()
+    np.savetxt(buf, arr, fmt=FORMATOS_CSV, delimiter=",", header=encabezado, comments="", encoding="utf-8")
+    return buf.getvalue()
+
+
+def add_scatter_to(
+    fig,
+    row,
+    col,
+    x,
+    y,
+    name,
+    color,
+    dash=None,
+    hovertemplate=None
+):
+    """Agrega una serie a fig (en el subgráfico row/col si fig tiene subplots)."""
+    fig.add_trace(go.Scattergl(
+        x=x,
+        y=y,
+        mode="lines+markers" if len(x) <= MAX_PTS_MARCADORES else "lines",
+        name=name,
+        line=dict(color=color, dash=dash) if dash else dict(color=color),
+        marker=dict(size=5),
+        hovertemplate=hovertemplate
+    ), row=row, col=col)
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
 def grafico_curva(
-    x_q,
-    y_p,
+    x_q: np.ndarray,
+    y_p: np.ndarray,
     titulo,
     xlab,
     ylab,
@@ -150,50 +210,99 @@ def grafico_curva(
     dash=None
 ):
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=x_q,
-        y=y_p,
-        mode="lines+markers",
-        name=nombre_serie,
-        line=dict(color=color, dash=dash) if dash else dict(color=color)
-    ))
+    add_scatter_to(
+        fig, None, None, x_q, y_p, nombre_serie, color, dash,
+        hovertemplate="%{x:,.0f} veh/día<br>%{y:.3f} USD/km<extra></extra>"
+    )
 
     fig.update_layout(
+        **BASE_LAYOUT,
         title=titulo,
         xaxis_title=xlab,
-        yaxis_title=ylab,
-        template="plotly_white",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5)
+        yaxis_title=ylab
     )
     return fig
 
 
+@st.cache_resource(max_entries=32, show_spinner=False)
 def grafico_recaudacion(
-    x_tarifa_liv,
-    y_val,
+    x_tarifa_liv: np.ndarray,
+    paneles: tuple,
     titulo,
-    ylab,
-    color,
-    dash=None
+    ylab
 ):
-    fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=x_tarifa_liv,
-        y=y_val,
-        mode="lines+markers",
-        name="Recaudación",
-        line=dict(color=color, dash=dash) if dash else dict(color=color)
-    ))
+    """
+    Una sola figura con un subgráfico por serie de recaudación (ejes y independientes).
+    paneles: tupla de (y, subtitulo, nombre_serie, color, dash).
+    """
+    fig = make_subplots(rows=1, cols=len(paneles), subplot_titles=[p[1] for p in paneles])
+    for j, (y_val, _, nombre_serie, color, dash) in enumerate(paneles, start=1):
+        add_scatter_to(
+            fig, 1, j, x_tarifa_liv, y_val, nombre_serie, color, dash,
+            hovertemplate="%{x:.3f} USD/km<br>$%{y:,.0f}<extra></extra>"
+        )
+
+    fig.update_xaxes(title_text="Tarifa livianos (USD por km)")
+    fig.update_yaxes(title_text=ylab, col=1)
+    # Cada subgráfico ya lleva su subtítulo: la leyenda sobra
     fig.update_layout(
+        **BASE_LAYOUT,
         title=titulo,
-        xaxis_title="Tarifa livianos (USD por km)",
-        yaxis_title=ylab,
-        template="plotly_white",
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5)
+        showlegend=False
     )
     return fig
 
 
+def grafico_recaudacion_anual(
+    fig_dia,
+    titulo,
+    ylab
+):
+    """
+    Versión anual de la figura diaria (ya cacheada): la clona y escala sus series por 365,
+    en float64 como las columnas anuales del CSV. Sin caché propia: solo copia una figura.
+    """
+    fig = go.Figure(fig_dia)
+    fig.for_each_trace(lambda tr: tr.update(y=np.asarray(tr.y, dtype=float) * 365))
+    fig.update_yaxes(title_text=ylab, col=1)
+    fig.update_layout(title=titulo)
+    return fig
+
+
+def mostrar_recaudacion(
+    res: Resultados,
+    tipo_vehiculo: str,
+    anual: bool,
+    mostrar_total: bool
+):
+    """Construye y muestra solo los gráficos de recaudación del periodo y vehículos seleccionados."""
+    rev = res.rev_day
+
+    paneles = []
+    if tipo_vehiculo in ["Livianos", "Ambos"]:
+        paneles.append((rev[0], "Livianos", "Livianos", COLOR_2, "dot"))
+    if tipo_vehiculo in ["Camiones (buses + pesados)", "Ambos"]:
+        paneles.append((rev[1], "Camiones", "Camiones", COLOR_3, "dash"))
+    if mostrar_total:
+        paneles.append((rev[2], "Total (Livianos + Camiones)", "Total", COLOR_1, None))
+
+    paneles = tuple(paneles)
+
+    fig = grafico_recaudacion(
+        x_tarifa_liv=res.tarifa_liv,
+        paneles=paneles,
+        titulo="Recaudación – Ruta Viva",
+        ylab="Recaudación (USD por día)"
+    )
+    if anual:
+        fig = grafico_recaudacion_anual(
+            fig,
+            titulo="Recaudación anual – Ruta Viva",
+            ylab="Recaudación (USD por año)"
+        )
+    st.plotly_chart(fig, use_container_width=True)
+
+
 # =====================================================
 # SIDEBAR (PARÁMETROS) + BOTÓN RESET
 # =====================================================
@@ -221,15 +330,11 @@ st.sidebar.subheader("Distancia (para recaudación)")
 dist_km = st.sidebar.number_input("Distancia promedio (km)", min_value=0.1, step=0.5, format="%.2f", key="dist_km")
 st.sidebar.caption("Ingreso por vehículo = tarifa (USD/km) × distancia (km)")
 
-df_prob = tabla_probabilidades_base()
-
 st.sidebar.subheader("Rango de tarifa (livianos)")
 pmin = st.sidebar.number_input("Tarifa mínima (USD/km)", min_value=0.0, step=0.01, format="%.2f", key="pmin")
 pmax = st.sidebar.number_input("Tarifa máxima (USD/km)", min_value=0.0, step=0.01, format="%.2f", key="pmax")
 npts = st.sidebar.slider("Número de puntos (curva)", min_value=5, max_value=250, step=1, key="npts")
 
-tarifa_grid = np.linspace(float(pmin), float(pmax), int(npts))
-
 st.sidebar.subheader("Visualización")
 tipo_vehiculo = st.sidebar.selectbox(
     "Tipo de vehículo",
@@ -243,13 +348,23 @@ ruta = st.sidebar.selectbox(
     key="ruta"
 )
 
+# Con "Ambos" la recaudación total se muestra siempre: la casilla solo aparece para un tipo
+if tipo_vehiculo == "Ambos":
+    mostrar_total = True
+else:
+    mostrar_total = st.sidebar.checkbox(
+        "Mostrar recaudación total (livianos + camiones)",
+        key="mostrar_total"
+    )
+
 
 # =====================================================
 # CÁLCULO
 # =====================================================
-resultados = calcular_resultados(
-    df_prob=df_prob,
-    tarifa_grid_liv=tarifa_grid,
+resultados = _calc_core(
+    pmin=pmin,
+    pmax=pmax,
+    npts=npts,
     tpda_liv=tpda_liv,
     tpda_cam=tpda_cam,
     mult_cam=mult_cam,
@@ -262,7 +377,8 @@ resultados = calcular_resultados(
 st.subheader("Descarga de resultados")
 st.caption("Descarga el CSV con las variables usadas en los gráficos (probabilidades, cantidades y recaudación).")
 
-csv_bytes = resultados.to_csv(index=False).encode("utf-8")
+tabla_csv = _tabla_csv(resultados)
+csv_bytes = _csv_bytes(tabla_csv.tobytes(), tabla_csv.shape, ENCABEZADO_CSV)
 st.download_button(
     "📥 Descargar resultados (CSV)",
     data=csv_bytes,
@@ -276,10 +392,11 @@ st.download_button(
 # =====================================================
 st.subheader("Recaudación esperada (Ruta Viva)")
 
-idx_max = int(resultados["recaud_total_usd_dia"].idxmax())
-tarifa_opt = float(resultados.loc[idx_max, "tarifa_usd_km_livianos"])
-recaud_max_dia = float(resultados.loc[idx_max, "recaud_total_usd_dia"])
-recaud_max_anio = float(resultados.loc[idx_max, "recaud_total_usd_anio"])
+rev_total_dia = resultados.rev_day[2]
+idx_max = int(np.argmax(rev_total_dia))
+tarifa_opt = resultados.tarifa_liv[idx_max]
+recaud_max_dia = rev_total_dia[idx_max]
+recaud_max_anio = float(recaud_max_dia) * 365
 
 c1, c2, c3 = st.columns(3)
 c1.metric("Tarifa livianos que maximiza recaudación", f"${tarifa_opt:,.2f} / km")
@@ -298,24 +415,21 @@ st.caption(
 st.subheader("Curvas de demanda (precio vs cantidad)")
 
 if ruta == "Ruta Viva":
-    q_liv_col = "Q_rv_liv_veh_dia"
-    q_cam_col = "Q_rv_cam_veh_dia"
+    i_ruta = 0
     titulo_base = "Curva de demanda – Ruta Viva"
 elif ruta == "Mixto":
-    q_liv_col = "Q_mix_liv_veh_dia"
-    q_cam_col = "Q_mix_cam_veh_dia"
+    i_ruta = 1
     titulo_base = "Curva (implícita) – Mixto"
 else:
-    q_liv_col = "Q_int_liv_veh_dia"
-    q_cam_col = "Q_int_cam_veh_dia"
+    i_ruta = 2
     titulo_base = "Curva (implícita) – Interoceánica"
 
 colA, colB = st.columns(2)
 
 if tipo_vehiculo in ["Livianos", "Ambos"]:
     fig_liv = grafico_curva(
-        x_q=resultados[q_liv_col],
-        y_p=resultados["tarifa_usd_km_livianos"],
+        x_q=resultados.q_liv[i_ruta],
+        y_p=resultados.tarifa_liv,
         titulo=f"{titulo_base} (Vehículos livianos)",
         xlab=f"Cantidad esperada ({ruta}) – livianos (veh/día)",
         ylab="Tarifa (USD por km)",
@@ -327,8 +441,8 @@ if tipo_vehiculo in ["Livianos", "Ambos"]:
 
 if tipo_vehiculo in ["Camiones (buses + pesados)", "Ambos"]:
     fig_cam = grafico_curva(
-        x_q=resultados[q_cam_col],
-        y_p=resultados["tarifa_usd_km_camiones"],
+        x_q=resultados.q_cam[i_ruta],
+        y_p=resultados.tarifa_cam,
         titulo=f"{titulo_base} (Camiones: buses + pesados)",
         xlab=f"Cantidad esperada ({ruta}) – camiones (veh/día)",
         ylab="Tarifa (USD por km)",
@@ -347,77 +461,20 @@ st.caption("Nota visual: si seleccionas 'Ambos', verás dos gráficos separados
 # =====================================================
 st.subheader("Curvas de recaudación (Ruta Viva)")
 
-tab1, tab2 = st.tabs(["USD por día", "USD por año"])
-
-with tab1:
-    c1, c2, c3 = st.columns(3)
-
-    if tipo_vehiculo in ["Livianos", "Ambos"]:
-        fig = grafico_recaudacion(
-            x_tarifa_liv=resultados["tarifa_usd_km_livianos"],
-            y_val=resultados["recaud_liv_usd_dia"],
-            titulo="Recaudación – Livianos (Ruta Viva)",
-            ylab="Recaudación (USD por día)",
-            color=COLOR_2,
-            dash="dot"
-        )
-        c1.plotly_chart(fig, use_container_width=True)
-
-    if tipo_vehiculo in ["Camiones (buses + pesados)", "Ambos"]:
-        fig = grafico_recaudacion(
-            x_tarifa_liv=resultados["tarifa_usd_km_livianos"],
-            y_val=resultados["recaud_cam_usd_dia"],
-            titulo="Recaudación – Camiones (Ruta Viva)",
-            ylab="Recaudación (USD por día)",
-            color=COLOR_3,
-            dash="dash"
-        )
-        (c2 if tipo_vehiculo == "Ambos" else c1).plotly_chart(fig, use_container_width=True)
-
-    fig = grafico_recaudacion(
-        x_tarifa_liv=resultados["tarifa_usd_km_livianos"],
-        y_val=resultados["recaud_total_usd_dia"],
-        titulo="Recaudación – Total (Livianos + Camiones) – Ruta Viva",
-        ylab="Recaudación (USD por día)",
-        color=COLOR_1,
-        dash=None
-    )
-    (c3 if tipo_vehiculo == "Ambos" else c2).plotly_chart(fig, use_container_width=True)
-
-with tab2:
-    c1, c2, c3 = st.columns(3)
-
-    if tipo_vehiculo in ["Livianos", "Ambos"]:
-        fig = grafico_recaudacion(
-            x_tarifa_liv=resultados["tarifa_usd_km_livianos"],
-            y_val=resultados["recaud_liv_usd_anio"],
-            titulo="Recaudación anual – Livianos (Ruta Viva)",
-            ylab="Recaudación (USD por año)",
-            color=COLOR_2,
-            dash="dot"
-        )
-        c1.plotly_chart(fig, use_container_width=True)
-
-    if tipo_vehiculo in ["Camiones (buses + pesados)", "Ambos"]:
-        fig = grafico_recaudacion(
-            x_tarifa_liv=resultados["tarifa_usd_km_livianos"],
-            y_val=resultados["recaud_cam_usd_anio"],
-            titulo="Recaudación anual – Camiones (Ruta Viva)",
-            ylab="Recaudación (USD por año)",
-            color=COLOR_3,
-            dash="dash"
-        )
-        (c2 if tipo_vehiculo == "Ambos" else c1).plotly_chart(fig, use_container_width=True)
-
-    fig = grafico_recaudacion(
-        x_tarifa_liv=resultados["tarifa_usd_km_livianos"],
-        y_val=resultados["recaud_total_usd_anio"],
-        titulo="Recaudación anual – Total (Livianos + Camiones) – Ruta Viva",
-        ylab="Recaudación (USD por año)",
-        color=COLOR_1,
-        dash=None
-    )
-    (c3 if tipo_vehiculo == "Ambos" else c2).plotly_chart(fig, use_container_width=True)
+# Solo se construyen los gráficos del periodo elegido
+periodo = st.radio(
+    "Periodo",
+    ["USD por día", "USD por año"],
+    horizontal=True,
+    key="periodo_recaud",
+    label_visibility="collapsed"
+)
+mostrar_recaudacion(
+    res=resultados,
+    tipo_vehiculo=tipo_vehiculo,
+    anual=(periodo == "USD por año"),
+    mostrar_total=mostrar_total
+)
 
 st.caption(
     "Importante: la recaudación se calcula solo para Ruta Viva (porque es donde existe peaje). "